@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from ..features.saturation import hill
+
+
+@dataclass
+class ResponseCurves:
+    """Per-channel incremental response and marginal ROI on a uniform spend grid.
+
+    Row ``i`` of ``response`` / ``marginal`` is channel ``channels[i]`` evaluated
+    at ``np.linspace(0, spend_max[i], n_points)`` per-period spend, held
+    constant (adstock at steady state). Values are in model (target-transform)
+    units, relative to zero spend.
+    """
+
+    channels: list[str]
+    spend_max: np.ndarray  # (C,)
+    response: np.ndarray  # (C, n_points)
+    marginal: np.ndarray  # (C, n_points)
+
+    @property
+    def n_points(self) -> int:
+        return self.response.shape[1]
+
+    def spend_grid(self, channel: str) -> np.ndarray:
+        return np.linspace(0.0, self.spend_max[self.channels.index(channel)], self.n_points)
+
+    def save(self, path: str | Path) -> None:
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            p,
+            channels=np.array(self.channels),
+            spend_max=self.spend_max,
+            response=self.response.astype(np.float32),
+            marginal=self.marginal.astype(np.float32),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ResponseCurves":
+        with np.load(path) as z:
+            return cls(
+                channels=[str(c) for c in z["channels"]],
+                spend_max=z["spend_max"],
+                response=z["response"],
+                marginal=z["marginal"],
+            )
+
+    def lookup(self, channels, spend, kind: str = "response") -> np.ndarray:
+        """Batched linear interpolation, equivalent to ``np.interp`` per channel.
+
+        ``channels`` is a name, a list/array of names, or integer row indices,
+        broadcast against ``spend``. Spend outside the grid is clamped to its
+        end points; non-finite spend (NaN/inf) yields NaN.
+        """
+        table = {"response": self.response, "marginal": self.marginal}.get(kind)
+        if table is None:
+            raise ValueError(f"Unknown kind: {kind!r} (expected 'response' or 'marginal')")
+
+        idx = np.asarray(channels)
+        if idx.dtype.kind in "US":
+            pos = {c: i for i, c in enumerate(self.channels)}
+            try:
+                idx = np.vectorize(pos.__getitem__, otypes=[np.intp])(idx)
+            except KeyError as e:
+                raise KeyError(f"Unknown channel: {e.args[0]}") from None
+        idx, spend = np.broadcast_arrays(idx.astype(np.intp), np.asarray(spend, dtype=float))
+
+        # uniform grid -> bucket index is arithmetic, no search needed
+        n = self.n_points
+        scale = np.where(self.spend_max > 0, (n - 1) / np.where(self.spend_max > 0, self.spend_max, 1.0), 0.0)
+        finite = np.isfinite(spend)
+        pos = np.clip(np.where(finite, spend, 0.0) * scale[idx], 0.0, n - 1)
+        lo = np.minimum(pos.astype(np.intp), n - 2)
+        w = pos - lo
+        out = table[idx, lo] * (1.0 - w) + table[idx, lo + 1] * w
+        return np.where(finite, out, np.nan)
+
+
+def channel_response(
+    spend: np.ndarray,
+    coef: float,
+    alpha: float | None = None,
+    ec50: float | None = None,
+    slope: float | None = None,
+    feature_transform: str = "none",
+    scaler_scale: float = 1.0,
+) -> np.ndarray:
+    """Incremental outcome per period for a constant per-period ``spend``.
+
+    Mirrors the pipeline's feature chain: geometric adstock at its steady state
+    ``S / (1 - alpha)``, then ``hill`` saturation, then the optional log1p
+    feature transform and the scaler. The scaler mean cancels against the
+    zero-spend baseline, so only its scale matters.
+    """
+    s = np.asarray(spend, dtype=float)
+
+    def feature(x: np.ndarray) -> np.ndarray:
+        if alpha is not None:
+            if alpha >= 1.0:
+                raise ValueError(f"adstock alpha must be < 1 for a steady state, got {alpha}")
+            x = x / (1.0 - alpha)
+        if ec50 is not None:
+            x = hill(x, ec50=ec50, slope=slope if slope is not None else 1.0)
+        if feature_transform == "log1p":
+            x = np.log1p(np.maximum(x, 0.0))
+        return x
+
+    return float(coef) / float(scaler_scale) * (feature(s) - feature(np.zeros(1)))
+
+
+def build_response_curves(
+    channels: list[str],
+    coef: np.ndarray,
+    spend_max: np.ndarray,
+    alphas: dict[str, float] | None = None,
+    hill_params: dict[str, tuple[float, float]] | None = None,
+    feature_transform: str = "none",
+    scaler_scale: np.ndarray | None = None,
+    n_points: int = 1024,
+) -> ResponseCurves:
+    """Evaluate every channel's response and marginal ROI on a dense spend grid.
+
+    ``coef`` and ``scaler_scale`` are aligned with ``channels`` (the channel's
+    model feature). ``alphas`` / ``hill_params`` are ``None`` when that
+    transform is disabled.
+    """
+    if n_points < 2:
+        raise ValueError("n_points must be >= 2")
+    spend_max = np.asarray(spend_max, dtype=float)
+    response = np.empty((len(channels), n_points))
+    marginal = np.empty_like(response)
+    for i, c in enumerate(channels):
+        grid = np.linspace(0.0, spend_max[i], n_points)
+        ec50, slope = hill_params[c] if hill_params is not None else (None, None)
+        response[i] = channel_response(
+            grid,
+            coef=coef[i],
+            alpha=None if alphas is None else alphas.get(c, 0.0),
+            ec50=ec50,
+            slope=slope,
+            feature_transform=feature_transform,
+            scaler_scale=1.0 if scaler_scale is None else scaler_scale[i],
+        )
+        marginal[i] = np.gradient(response[i], grid) if spend_max[i] > 0 else 0.0
+    return ResponseCurves(channels=list(channels), spend_max=spend_max, response=response, marginal=marginal)
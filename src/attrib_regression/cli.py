@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from attrib_regression.config import load_rba_config
@@ -11,21 +12,192 @@ from attrib_regression.validation import validate_dataframe
 from attrib_regression.preprocess import basic_clean
 from attrib_regression.features.adstock import apply_adstock
 from attrib_regression.features.saturation import apply_saturation
-from attrib_regression.features.build_matrix import build_xy
+from attrib_regression.features.build_matrix import DesignMatrix, build_xy
+from attrib_regression.eval.backtest import rolling_origin_backtest
 from attrib_regression.eval.tscv import TimeSeriesCV
-from attrib_regression.models.train import fit_elasticnet_ts_cv
-from attrib_regression.models.diagnostics import coef_table
-from attrib_regression.attribution.decompose import decompose_linear
+from attrib_regression.models.train import FitResult, fit_elasticnet_adaptive_ts_cv, fit_elasticnet_ts_cv
+from attrib_regression.models.diagnostics import coef_table, fit_diagnostics
+from attrib_regression.models.pooled import decompose_pooled, fit_pooled_elasticnet_ts_cv
+from attrib_regression.attribution.decompose import ContributionResult, decompose_linear
+from attrib_regression.attribution.response import ResponseCurves, build_response_curves
 from attrib_regression.attribution.roi import compute_roi
+from attrib_regression.viz.render import FigureJob, render_figures
 
 
-def main() -> None:
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--config", required=True, help="Path to YAML config")
-    args = ap.parse_args()
+def transform_features(df: pd.DataFrame, cfg) -> tuple[pd.DataFrame, list[str]]:
+    """Apply configured adstock/saturation; return the frame and model feature cols."""
+    media_cols = cfg.variables.media_spend_cols
+    control_cols = cfg.variables.control_cols
 
-    cfg = load_rba_config(args.config)
+    media_work_cols = media_cols
+    if cfg.transforms.adstock.enabled:
+        df = apply_adstock(
+            df,
+            cols=media_cols,
+            alphas=vars(cfg.transforms.adstock.alphas),
+            max_lag=cfg.transforms.adstock.max_lag,
+        )
+        media_work_cols = [f"{c}__adstock" for c in media_cols]
+
+    if cfg.transforms.saturation.enabled:
+        df = apply_saturation(df, cols=media_work_cols, params=vars(cfg.transforms.saturation.params))
+        media_work_cols = [f"{c}__sat" for c in media_work_cols]
+
+    return df, media_work_cols + control_cols
+
+
+def _figure_job(name: str, dates: pd.Series, actual: np.ndarray, contrib: ContributionResult) -> FigureJob:
+    pred = contrib.contributions.drop(columns=["date"], errors="ignore").sum(axis=1).to_numpy()
+    return FigureJob(name=name, dates=dates.to_numpy(), actual=actual, pred=pred, totals=contrib.totals)
+
+
+def _render_stage(cfg, jobs: list[FigureJob]) -> None:
+    """Batch-render figures into outputs.figures_dir when outputs.figures.enabled."""
+    fcfg = getattr(cfg.outputs, "figures", None)
+    if fcfg is None or not getattr(fcfg, "enabled", False):
+        return
+    paths = render_figures(
+        jobs,
+        cfg.outputs.figures_dir,
+        max_points=getattr(fcfg, "max_points", 2000),
+        max_workers=getattr(fcfg, "workers", None),
+    )
+    print("Rendered", len(paths), "figures to:", Path(cfg.outputs.figures_dir).resolve())
+
+
+def _response_curves(cfg, spend: pd.DataFrame, coef: np.ndarray, scaler) -> ResponseCurves | None:
+    """Dense per-channel response tables (outputs.response_curves), or None if disabled."""
+    rc_cfg = getattr(cfg.outputs, "response_curves", None)
+    if rc_cfg is None or not getattr(rc_cfg, "enabled", False):
+        return None
+
+    # media features lead feature_cols, in media_spend_cols order
+    media_cols = cfg.variables.media_spend_cols
+    n_media = len(media_cols)
+
+    alphas = None
+    if cfg.transforms.adstock.enabled:
+        alphas = {c: float(vars(cfg.transforms.adstock.alphas).get(c, 0.0)) for c in media_cols}
+
+    hill_params = None
+    if cfg.transforms.saturation.enabled:
+        # resolve exactly as apply_saturation does (keyed by the column it saturates)
+        params = vars(cfg.transforms.saturation.params)
+        hill_params = {}
+        for c in media_cols:
+            p = params.get(f"{c}__adstock" if alphas is not None else c, {})
+            p = p if isinstance(p, dict) else vars(p)
+            hill_params[c] = (float(p.get("ec50", 1.0)), float(p.get("slope", 1.0)))
+
+    return build_response_curves(
+        media_cols,
+        coef=np.asarray(coef)[:n_media],
+        spend_max=spend[media_cols].max(axis=0).to_numpy() * float(getattr(rc_cfg, "max_multiplier", 2.0)),
+        alphas=alphas,
+        hill_params=hill_params,
+        feature_transform=cfg.model.feature_transform,
+        scaler_scale=None if scaler is None else scaler.scale_[:n_media],
+        n_points=int(getattr(rc_cfg, "n_points", 1024)),
+    )
+
+
+def _run_pooled(cfg, df: pd.DataFrame, group_col: str, reports_dir: Path, config_path: str | Path) -> dict:
+    """Pooled mode: one sparse ElasticNet over all groups, reports per group."""
+    if getattr(cfg.model, "search", "grid") != "grid":
+        raise ValueError("model.pooled supports model.search: grid only.")
+    bt_cfg = getattr(cfg, "backtest", None)
+    if bt_cfg is not None and getattr(bt_cfg, "enabled", False):
+        raise ValueError("backtest.enabled is not supported with model.pooled; disable one of them.")
+    media_cols = cfg.variables.media_spend_cols
+
+    # transforms run per group so adstock carryover never crosses groups
+    frames: dict[str, pd.DataFrame] = {}
+    X_by_group: dict[str, np.ndarray] = {}
+    y_by_group: dict[str, np.ndarray] = {}
+    feature_names: list[str] = []
+    for g, gdf in df.groupby(group_col, sort=True):
+        gdf, feature_cols = transform_features(gdf.reset_index(drop=True), cfg)
+        dm = build_xy(
+            gdf,
+            target_col=cfg.data.target_col,
+            feature_cols=feature_cols,
+            target_transform=cfg.model.target_transform,
+            feature_transform=cfg.model.feature_transform,
+        )
+        frames[str(g)] = gdf
+        X_by_group[str(g)] = dm.X
+        y_by_group[str(g)] = dm.y
+        feature_names = dm.feature_names
+
+    cv = TimeSeriesCV(
+        n_splits=cfg.model.cv.n_splits,
+        test_size=cfg.model.cv.test_size,
+        gap=cfg.model.cv.gap,
+    )
+
+    fit, best_params = fit_pooled_elasticnet_ts_cv(
+        X_by_group,
+        y_by_group,
+        feature_names,
+        positive=cfg.model.positive_media,
+        standardize=cfg.model.standardize,
+        cv=cv,
+        param_grid=vars(cfg.model.hyperparams),
+        random_state=getattr(cfg.model, "random_state", 42),
+    )
 
+    if fit.negative_group_coefs:
+        print(
+            "Note: positive_media bounds only the shared coefficients in pooled mode; negative per-group coefficients:",
+            ", ".join(f"{g}/{f}" for g, f in fit.negative_group_coefs),
+        )
+
+    contribs = decompose_pooled(
+        fit,
+        X_by_group,
+        {g: frames[g][cfg.data.date_col] for g in fit.groups},
+    )
+
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    (reports_dir / "config_used.yml").write_text(Path(config_path).read_text(encoding="utf-8"), encoding="utf-8")
+
+    coef_table(feature_names, fit.global_coef_).to_csv(reports_dir / "coef_table.csv", index=False)
+    pd.DataFrame(fit.metrics_by_fold).to_csv(reports_dir / "cv_metrics.csv", index=False)
+
+    for g in fit.groups:
+        contrib = contribs[g]
+        spend_totals = frames[g][media_cols].sum(axis=0)
+        media_totals = contrib.totals.reindex([c for c in contrib.totals.index if c.startswith(tuple(media_cols))], fill_value=0)
+        roi = compute_roi(media_totals, spend_totals.reindex(media_cols))
+
+        group_dir = reports_dir / "groups" / g
+        group_dir.mkdir(parents=True, exist_ok=True)
+        coef_table(feature_names, fit.group_coef_[g]).to_csv(group_dir / "coef_table.csv", index=False)
+        coef_diag, fit_diag = fit_diagnostics(
+            fit.stats[g].transform(X_by_group[g]), y_by_group[g], feature_names, fit.group_coef_[g], fit.group_intercept_[g]
+        )
+        coef_diag.to_csv(group_dir / "coef_diagnostics.csv", index=False)
+        fit_diag.to_csv(group_dir / "fit_diagnostics.csv", index=False)
+        contrib.contributions.to_csv(group_dir / "contributions_timeseries.csv", index=False)
+        contrib.totals.to_csv(group_dir / "contribution_totals.csv")
+        roi.to_csv(group_dir / "roi_summary.csv", index=False)
+
+        curves = _response_curves(cfg, frames[g], fit.group_coef_[g], fit.stats[g].scaler)
+        if curves is not None:
+            curves.save(group_dir / "response_curves.npz")
+
+    _render_stage(
+        cfg,
+        [_figure_job(g, frames[g][cfg.data.date_col], y_by_group[g], contribs[g]) for g in fit.groups],
+    )
+
+    print("Best params:", best_params)
+    print("Wrote pooled reports for", len(fit.groups), "groups to:", reports_dir.resolve())
+    return {"best_params": best_params, "reports_dir": str(reports_dir.resolve()), "groups": fit.groups}
+
+
+def load_data(cfg) -> pd.DataFrame:
+    """Read, validate and clean the configured input table."""
     # --- read once ---
     df = read_table(cfg.data.path)
 
@@ -40,27 +212,12 @@ def main() -> None:
     print("Data validation passed:", report)
 
     # --- clean (sorts by date, drops NA dates, etc.) ---
-    df = basic_clean(df, date_col=cfg.data.date_col)
+    return basic_clean(df, date_col=cfg.data.date_col)
 
-    media_cols = cfg.variables.media_spend_cols
-    control_cols = cfg.variables.control_cols
 
-    # --- transforms ---
-    media_work_cols = media_cols
-    if cfg.transforms.adstock.enabled:
-        df = apply_adstock(
-            df,
-            cols=media_cols,
-            alphas=vars(cfg.transforms.adstock.alphas),
-            max_lag=cfg.transforms.adstock.max_lag,
-        )
-        media_work_cols = [f"{c}__adstock" for c in media_cols]
-
-    if cfg.transforms.saturation.enabled:
-        df = apply_saturation(df, cols=media_work_cols, params=vars(cfg.transforms.saturation.params))
-        media_work_cols = [f"{c}__sat" for c in media_work_cols]
-
-    feature_cols = media_work_cols + control_cols
+def fit_single(cfg, df: pd.DataFrame) -> tuple[pd.DataFrame, DesignMatrix, FitResult, dict]:
+    """Transform, build the design matrix and grid-search one ElasticNet."""
+    df, feature_cols = transform_features(df, cfg)
 
     dm = build_xy(
         df,
@@ -76,7 +233,14 @@ def main() -> None:
         gap=cfg.model.cv.gap,
     )
 
-    fit, best_params = fit_elasticnet_ts_cv(
+    search_kwargs = {}
+    search_fn = fit_elasticnet_ts_cv
+    if getattr(cfg.model, "search", "grid") == "adaptive":
+        search_fn = fit_elasticnet_adaptive_ts_cv
+        adaptive = getattr(cfg.model, "adaptive", None)
+        search_kwargs = vars(adaptive) if adaptive is not None else {}
+
+    fit, best_params = search_fn(
         dm.X,
         dm.y,
         dm.feature_names,
@@ -85,9 +249,29 @@ def main() -> None:
         cv=cv,
         param_grid=vars(cfg.model.hyperparams),
         random_state=getattr(cfg.model, "random_state", 42),
+        **search_kwargs,
     )
+    return df, dm, fit, best_params
+
+
+def run_pipeline(cfg, config_path: str | Path, df: pd.DataFrame | None = None) -> dict:
+    """Full pipeline: fit, decompose and write reports. Returns a short summary.
+
+    ``df`` may be passed in (already loaded and cleaned) to skip ``load_data``.
+    """
+    if df is None:
+        df = load_data(cfg)
+
+    media_cols = cfg.variables.media_spend_cols
+    reports_dir = Path(cfg.outputs.reports_dir)
+
+    group_col = getattr(cfg.data, "group_col", None)
+    if group_col and getattr(cfg.model, "pooled", False):
+        return _run_pooled(cfg, df, group_col, reports_dir, config_path)
+
+    df, dm, fit, best_params = fit_single(cfg, df)
 
-    # --- contributions (in-sample; add holdout later) ---
+    # --- contributions (in-sample; out-of-sample via the backtest stage) ---
     X_for_contrib = dm.X
     if fit.scaler is not None:
         X_for_contrib = fit.scaler.transform(X_for_contrib)
@@ -105,21 +289,60 @@ def main() -> None:
     media_totals = contrib.totals.reindex([c for c in contrib.totals.index if c.startswith(tuple(media_cols))], fill_value=0)
     roi = compute_roi(media_totals, spend_totals.reindex(media_cols))
 
-    reports_dir = Path(cfg.outputs.reports_dir)
     reports_dir.mkdir(parents=True, exist_ok=True)
 
     # provenance
-    (reports_dir / "config_used.yml").write_text(Path(args.config).read_text(encoding="utf-8"), encoding="utf-8")
+    (reports_dir / "config_used.yml").write_text(Path(config_path).read_text(encoding="utf-8"), encoding="utf-8")
 
     coef_df = coef_table(dm.feature_names, fit.coef_)
     coef_df.to_csv(reports_dir / "coef_table.csv", index=False)
+    coef_diag, fit_diag = fit_diagnostics(X_for_contrib, dm.y, dm.feature_names, fit.coef_, fit.intercept_)
+    coef_diag.to_csv(reports_dir / "coef_diagnostics.csv", index=False)
+    fit_diag.to_csv(reports_dir / "fit_diagnostics.csv", index=False)
     pd.DataFrame(fit.metrics_by_fold).to_csv(reports_dir / "cv_metrics.csv", index=False)
     contrib.contributions.to_csv(reports_dir / "contributions_timeseries.csv", index=False)
     contrib.totals.to_csv(reports_dir / "contribution_totals.csv")
     roi.to_csv(reports_dir / "roi_summary.csv", index=False)
 
+    curves = _response_curves(cfg, df, fit.coef_, fit.scaler)
+    if curves is not None:
+        curves.save(reports_dir / "response_curves.npz")
+
+    _render_stage(cfg, [_figure_job("all", df[cfg.data.date_col], dm.y, contrib)])
+
+    bt_cfg = getattr(cfg, "backtest", None)
+    if bt_cfg is not None and getattr(bt_cfg, "enabled", False):
+        bt = rolling_origin_backtest(
+            dm.X,
+            dm.y,
+            dm.feature_names,
+            best_params,
+            positive=cfg.model.positive_media,
+            standardize=cfg.model.standardize,
+            min_train=bt_cfg.min_train,
+            step=getattr(bt_cfg, "step", 7),
+            horizon=getattr(bt_cfg, "horizon", 7),
+            gap=getattr(bt_cfg, "gap", 0),
+            date_index=df[cfg.data.date_col],
+            random_state=getattr(cfg.model, "random_state", 42),
+        )
+        bt.predictions.to_csv(reports_dir / "backtest_predictions.csv", index=False)
+        bt.contributions.to_csv(reports_dir / "backtest_contributions.csv", index=False)
+        bt.metrics.to_csv(reports_dir / "backtest_metrics.csv", index=False)
+        print("Backtest:", len(bt.metrics), "origins, mean MAPE", round(float(bt.metrics["mape"].mean()), 4))
+
     print("Best params:", best_params)
     print("Wrote reports to:", reports_dir.resolve())
+    return {"best_params": best_params, "reports_dir": str(reports_dir.resolve())}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--config", required=True, help="Path to YAML config")
+    args = ap.parse_args()
+
+    cfg = load_rba_config(args.config)
+    run_pipeline(cfg, args.config)
 
 
 if __name__ == "__main__":
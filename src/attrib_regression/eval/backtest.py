@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import ElasticNet
+from sklearn.metrics import mean_absolute_percentage_error, r2_score
+from sklearn.preprocessing import StandardScaler
+
+from ..attribution.decompose import decompose_linear
+
+
+@dataclass
+class BacktestResult:
+    predictions: pd.DataFrame  # origin, date, actual, pred
+    contributions: pd.DataFrame  # origin, date, per-feature contributions, intercept
+    metrics: pd.DataFrame  # one row per origin
+
+
+def rolling_origins(n_samples: int, min_train: int, step: int, horizon: int) -> list[int]:
+    """Origins (first out-of-sample index) for an expanding walk-forward."""
+    if min_train < 1:
+        raise ValueError("min_train must be >= 1")
+    if step < 1 or horizon < 1:
+        raise ValueError("step and horizon must be >= 1")
+    if min_train >= n_samples:
+        raise ValueError("Not enough samples for the requested backtest.")
+    return list(range(min_train, n_samples, step))
+
+
+def rolling_origin_backtest(
+    X: np.ndarray,
+    y: np.ndarray,
+    feature_names: list[str],
+    params: dict,
+    positive: bool,
+    standardize: bool,
+    min_train: int,
+    step: int = 7,
+    horizon: int = 7,
+    gap: int = 0,
+    date_index: pd.Series | None = None,
+    random_state: int = 42,
+) -> BacktestResult:
+    """Walk forward over the history, refitting the chosen model at each origin.
+
+    At origin ``t`` the model is trained on rows ``[0, t - gap)`` and scored
+    on ``[t, t + horizon)``. Refits are incremental:
+
+    - the ElasticNet is reused with ``warm_start=True``, so each solve starts
+      from the previous origin's coefficients;
+    - the scaler is updated with ``partial_fit`` on only the rows added since
+      the previous origin (exact running mean/variance, no rescans).
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    origins = rolling_origins(n, min_train, step, horizon)
+
+    model = ElasticNet(
+        alpha=float(params["alpha"]),
+        l1_ratio=float(params["l1_ratio"]),
+        fit_intercept=True,
+        positive=bool(positive),
+        max_iter=20000,
+        random_state=random_state,
+        warm_start=True,
+    )
+    scaler = StandardScaler() if standardize else None
+    seen = 0  # rows already folded into the scaler
+
+    preds, contribs, metrics = [], [], []
+    for origin in origins:
+        train_end = origin - gap
+        if train_end < 1:
+            raise ValueError(f"Origin {origin}: gap={gap} leaves no training samples.")
+        test = np.arange(origin, min(origin + horizon, n))
+
+        Xtr = X[:train_end]
+        Xte = X[test]
+        if scaler is not None:
+            if train_end > seen:
+                scaler.partial_fit(X[seen:train_end])
+                seen = train_end
+            Xtr = scaler.transform(Xtr)
+            Xte = scaler.transform(Xte)
+
+        model.fit(Xtr, y[:train_end])
+        pred = model.predict(Xte)
+        yte = y[test]
+
+        dates = None if date_index is None else date_index.iloc[test].reset_index(drop=True)
+        res = decompose_linear(
+            X=Xte,
+            feature_names=feature_names,
+            coef=model.coef_,
+            intercept=float(model.intercept_),
+            date_index=dates,
+        )
+        c = res.contributions
+        c.insert(0, "origin", origin)
+        contribs.append(c)
+
+        p = pd.DataFrame({"origin": origin, "row": test, "actual": yte, "pred": pred})
+        if dates is not None:
+            p.insert(2, "date", dates.to_numpy())
+        preds.append(p)
+
+        metrics.append(
+            {
+                "origin": origin,
+                "n_train": int(train_end),
+                "n_test": int(len(test)),
+                "mape": float(mean_absolute_percentage_error(yte, pred)),
+                "r2": float(r2_score(yte, pred)) if len(test) > 1 else np.nan,
+                "n_iter": int(model.n_iter_),
+            }
+        )
+
+    return BacktestResult(
+        predictions=pd.concat(preds, ignore_index=True),
+        contributions=pd.concat(contribs, ignore_index=True),
+        metrics=pd.DataFrame(metrics),
+    )
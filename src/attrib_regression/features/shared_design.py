@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+import numpy as np
+
+from .build_matrix import DesignMatrix
+
+
+@dataclass(frozen=True)
+class SharedDesign:
+    """Picklable handle to a DesignMatrix held outside any one process.
+
+    Only names/paths and shapes travel to workers; ``attach()`` maps the
+    data read-only without copying, for the duration of a ``with`` block.
+    """
+
+    backend: str  # "shm" | "memmap"
+    x_ref: str  # shared memory name or .npy path
+    y_ref: str
+    x_shape: tuple[int, ...]
+    y_shape: tuple[int, ...]
+    feature_names: tuple[str, ...]
+
+    @contextmanager
+    def attach(self) -> Iterator[DesignMatrix]:
+        """Map the design read-only; the mapping is released when the block exits.
+
+        Do not keep views of ``X``/``y`` past the block (copy what must outlive it).
+        """
+        if self.backend not in ("shm", "memmap"):
+            raise ValueError(f"Unknown backend: {self.backend}")
+
+        blocks: list[shared_memory.SharedMemory] = []
+        dm = DesignMatrix(X=None, y=None, feature_names=list(self.feature_names))
+        try:
+            if self.backend == "memmap":
+                dm.X = np.load(self.x_ref, mmap_mode="r")
+                dm.y = np.load(self.y_ref, mmap_mode="r")
+            else:
+                blocks = [_open_shm(self.x_ref), _open_shm(self.y_ref)]
+                dm.X = _view(blocks[0], self.x_shape)
+                dm.y = _view(blocks[1], self.y_shape)
+            yield dm
+        finally:
+            # drop our views first; close() fails while exported buffers exist
+            dm.X = dm.y = None
+            for b in blocks:
+                b.close()
+
+
+def _open_shm(name: str) -> shared_memory.SharedMemory:
+    # track=False (3.13+) stops attaching processes from unlinking the block at exit
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        return shared_memory.SharedMemory(name=name)
+
+
+def _view(shm: shared_memory.SharedMemory, shape: tuple[int, ...]) -> np.ndarray:
+    arr = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    arr.flags.writeable = False
+    return arr
+
+
+def _to_shm(a: np.ndarray) -> shared_memory.SharedMemory:
+    a = np.ascontiguousarray(a, dtype=np.float64)
+    shm = shared_memory.SharedMemory(create=True, size=max(a.nbytes, 1))
+    np.ndarray(a.shape, dtype=np.float64, buffer=shm.buf)[...] = a
+    return shm
+
+
+@contextmanager
+def share_design(
+    dm: DesignMatrix, backend: str = "shm", dir: str | Path | None = None
+) -> Iterator[SharedDesign]:
+    """Publish ``dm`` to shared memory (or ``.npy`` memmaps) for worker processes.
+
+    The owning process keeps the data alive for the duration of the ``with``
+    block and removes it on exit, including on error. Workers must be done
+    with their attached views before the block exits.
+    """
+    X = np.asarray(dm.X, dtype=np.float64)
+    y = np.asarray(dm.y, dtype=np.float64)
+    names = tuple(dm.feature_names)
+
+    if backend == "shm":
+        blocks = [_to_shm(X), _to_shm(y)]
+        try:
+            yield SharedDesign("shm", blocks[0].name, blocks[1].name, X.shape, y.shape, names)
+        finally:
+            for b in blocks:
+                b.close()
+                b.unlink()
+    elif backend == "memmap":
+        tmp = Path(tempfile.mkdtemp(prefix="rba_design_", dir=dir))
+        try:
+            np.save(tmp / "X.npy", X)
+            np.save(tmp / "y.npy", y)
+            yield SharedDesign(
+                "memmap", str(tmp / "X.npy"), str(tmp / "y.npy"), X.shape, y.shape, names
+            )
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+    else:
+        raise ValueError(f"Unknown backend: {backend}")
+
+
+def _call_attached(func: Callable[[DesignMatrix, Any], Any], handle: SharedDesign, item: Any) -> Any:
+    with handle.attach() as dm:
+        return func(dm, item)
+
+
+def map_shared(
+    func: Callable[[DesignMatrix, Any], Any],
+    dm: DesignMatrix,
+    items: Iterable[Any],
+    max_workers: int | None = None,
+    backend: str = "shm",
+) -> list[Any]:
+    """Run ``func(design, item)`` for each item on a process pool over one shared design.
+
+    ``func`` must be a module-level (picklable) function that returns no views
+    of the design. Workers attach by name for each task and detach when it
+    returns, so ``X``/``y`` are never pickled and never stay mapped.
+    """
+    items = list(items)
+    with share_design(dm, backend=backend) as handle:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_call_attached, func, handle, it) for it in items]
+            return [f.result() for f in futures]
@@ -1,7 +1,104 @@
 import numpy as np
 import pandas as pd
+import statsmodels.api as sm
+from statsmodels.stats.diagnostic import acorr_ljungbox, het_breuschpagan
+from statsmodels.stats.stattools import durbin_watson
 
 
 def coef_table(feature_names: list[str], coef: np.ndarray) -> pd.DataFrame:
     df = pd.DataFrame({"feature": feature_names, "coef": coef})
     return df.sort_values("coef", ascending=False).reset_index(drop=True)
+
+
+def vif(X: np.ndarray, rtol: float = 1e-10) -> np.ndarray:
+    """Variance inflation factors for every column in one go.
+
+    VIF_j is the j-th diagonal element of the inverse correlation matrix, so a
+    single eigendecomposition replaces p auxiliary regressions. Columns that
+    load on the (near-)null space -- eigenvalues below ``rtol`` x the largest,
+    i.e. exact linear combinations of other columns -- get ``inf``; the rest
+    are exact even when other columns are collinear. Constant columns get NaN.
+    """
+    X = np.asarray(X, dtype=float)
+    out = np.full(X.shape[1], np.nan)
+    live = X.std(axis=0) > 0
+    if live.sum() == 0:
+        return out
+    if live.sum() == 1:
+        out[live] = 1.0
+        return out
+    R = np.corrcoef(X[:, live], rowvar=False)
+    w, V = np.linalg.eigh(R)
+    null = w <= rtol * w.max()
+    vifs = (V[:, ~null] ** 2) @ (1.0 / w[~null])
+    collinear = np.abs(V[:, null]).max(axis=1, initial=0.0) > 1e-8
+    vifs[collinear] = np.inf
+    out[live] = vifs
+    return out
+
+
+def ols_refit(
+    X: np.ndarray, y: np.ndarray, feature_names: list[str], coef: np.ndarray
+) -> pd.DataFrame:
+    """Plain OLS on the ElasticNet-selected support (coef != 0) for standard errors.
+
+    Note: post-selection inference -- SEs ignore the selection step, so treat
+    p-values as optimistic.
+    """
+    support = np.flatnonzero(np.asarray(coef) != 0)
+    out = pd.DataFrame(
+        {"feature": feature_names, "ols_coef": np.nan, "ols_se": np.nan, "ols_t": np.nan, "ols_pvalue": np.nan}
+    )
+    if len(support) == 0 or len(y) <= len(support) + 1:
+        return out
+
+    res = sm.OLS(np.asarray(y, dtype=float), sm.add_constant(X[:, support], has_constant="add")).fit()
+    # skip the constant (first param)
+    out.loc[support, "ols_coef"] = np.asarray(res.params)[1:]
+    out.loc[support, "ols_se"] = np.asarray(res.bse)[1:]
+    out.loc[support, "ols_t"] = np.asarray(res.tvalues)[1:]
+    out.loc[support, "ols_pvalue"] = np.asarray(res.pvalues)[1:]
+    return out
+
+
+def residual_diagnostics(resid: np.ndarray, X: np.ndarray, lags: int = 7) -> dict:
+    """Durbin-Watson, Ljung-Box and Breusch-Pagan checks on model residuals."""
+    resid = np.asarray(resid, dtype=float)
+    out = {"n_obs": int(len(resid)), "durbin_watson": float(durbin_watson(resid))}
+
+    lags = min(lags, len(resid) - 1)
+    if lags >= 1:
+        lb = acorr_ljungbox(resid, lags=[lags])
+        out["ljung_box_lag"] = int(lags)
+        out["ljung_box_stat"] = float(lb["lb_stat"].iloc[0])
+        out["ljung_box_pvalue"] = float(lb["lb_pvalue"].iloc[0])
+
+    # Breusch-Pagan needs a non-degenerate regressor set
+    live = np.asarray(X, dtype=float)[:, np.asarray(X).std(axis=0) > 0]
+    if live.shape[1] > 0 and len(resid) > live.shape[1] + 1:
+        lm, lm_p, f, f_p = het_breuschpagan(resid, sm.add_constant(live, has_constant="add"))
+        out["breusch_pagan_lm"] = float(lm)
+        out["breusch_pagan_pvalue"] = float(lm_p)
+    return out
+
+
+def fit_diagnostics(
+    X: np.ndarray,
+    y: np.ndarray,
+    feature_names: list[str],
+    coef: np.ndarray,
+    intercept: float,
+    lags: int = 7,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Per-coefficient (VIF + OLS refit) and whole-fit (residual tests) diagnostics.
+
+    ``X`` must be on the scale the model was fitted on (i.e. after the scaler).
+    """
+    X = np.asarray(X, dtype=float)
+    coef_diag = ols_refit(X, y, feature_names, coef)
+    coef_diag.insert(1, "coef", np.asarray(coef, dtype=float))
+    coef_diag.insert(2, "vif", vif(X))
+
+    resid = np.asarray(y, dtype=float) - (X @ coef + intercept)
+    summary = residual_diagnostics(resid, X, lags=lags)
+    return coef_diag, pd.DataFrame({"metric": list(summary), "value": list(summary.values())})
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.linear_model import ElasticNet
+from sklearn.metrics import mean_absolute_percentage_error, r2_score
+from sklearn.preprocessing import StandardScaler
+
+from ..attribution.decompose import ContributionResult, decompose_linear
+from ..eval.tscv import TimeSeriesCV
+
+
+@dataclass
+class GroupStats:
+    scaler: StandardScaler | None
+    x_mean: np.ndarray  # column means after scaling (zero when standardized)
+    y_mean: float
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """Scale X the same way the pooled fit saw it (before centering)."""
+        return self.scaler.transform(X) if self.scaler is not None else X
+
+
+@dataclass
+class PooledFitResult:
+    model: ElasticNet
+    groups: list[str]
+    feature_names: list[str]
+    stats: dict[str, GroupStats]
+    global_coef_: np.ndarray
+    group_coef_: dict[str, np.ndarray]  # global + per-group deviation
+    group_intercept_: dict[str, float]
+    metrics_by_fold: list[dict]
+    # (group, feature) pairs whose coefficient is < 0 despite positive=True
+    negative_group_coefs: list[tuple[str, str]] = field(default_factory=list)
+
+
+def _fit_group_stats(X: np.ndarray, y: np.ndarray, standardize: bool) -> GroupStats:
+    scaler = StandardScaler().fit(X) if standardize else None
+    Xs = scaler.transform(X) if scaler is not None else X
+    return GroupStats(scaler=scaler, x_mean=Xs.mean(axis=0), y_mean=float(y.mean()))
+
+
+def build_pooled_design(blocks: list[np.ndarray], signed: bool = False) -> sparse.csr_matrix:
+    """Stack per-group blocks into ``[X_all | blockdiag(X_1, ..., X_G)]``.
+
+    The first ``p`` columns carry the shared (global) coefficients, the next
+    ``G * p`` columns carry one deviation block per group. With ``signed=True``
+    a negated copy ``-blockdiag(...)`` is appended, so that under a
+    non-negativity bound each deviation is ``d+ - d-`` and can take either sign.
+    """
+    shared = sparse.csr_matrix(np.vstack(blocks))
+    deviations = sparse.block_diag(blocks, format="csr")
+    parts = [shared, deviations, -deviations] if signed else [shared, deviations]
+    return sparse.hstack(parts, format="csr")
+
+
+def _split_coef(
+    coef: np.ndarray, n_features: int, n_groups: int, signed: bool = False
+) -> tuple[np.ndarray, list[np.ndarray]]:
+    global_coef = coef[:n_features]
+    n_dev = n_features * n_groups
+    devs = coef[n_features : n_features + n_dev]
+    if signed:
+        devs = devs - coef[n_features + n_dev : n_features + 2 * n_dev]
+    return global_coef, [global_coef + d for d in devs.reshape(n_groups, n_features)]
+
+
+def _fit_pooled(
+    Xs: list[np.ndarray],
+    ys: list[np.ndarray],
+    alpha: float,
+    l1_ratio: float,
+    positive: bool,
+    standardize: bool,
+    random_state: int,
+) -> tuple[ElasticNet, list[GroupStats]]:
+    """One ElasticNet solve on the group-centered block design.
+
+    With ``positive=True`` the design gets signed deviation blocks, so only
+    the shared coefficients are bounded at zero.
+    """
+    stats = [_fit_group_stats(X, y, standardize) for X, y in zip(Xs, ys)]
+    blocks = [s.transform(X) - s.x_mean for X, s in zip(Xs, stats)]
+    yc = np.concatenate([y - s.y_mean for y, s in zip(ys, stats)])
+
+    # Centering per group absorbs the per-group intercepts, so the penalized
+    # solve does not need (and must not constrain) intercept columns.
+    m = ElasticNet(
+        alpha=float(alpha),
+        l1_ratio=float(l1_ratio),
+        fit_intercept=False,
+        positive=bool(positive),
+        max_iter=20000,
+        random_state=random_state,
+    )
+    m.fit(build_pooled_design(blocks, signed=positive), yc)
+    return m, stats
+
+
+def _predict_groups(
+    coef: np.ndarray, stats: list[GroupStats], Xs: list[np.ndarray], signed: bool = False
+) -> list[np.ndarray]:
+    p = Xs[0].shape[1]
+    _, group_coefs = _split_coef(coef, p, len(Xs), signed)
+    return [
+        (s.transform(X) - s.x_mean) @ c + s.y_mean if len(X) else np.empty(0)
+        for X, s, c in zip(Xs, stats, group_coefs)
+    ]
+
+
+def _group_folds(
+    cv: TimeSeriesCV, n_samples: int
+) -> list[tuple[np.ndarray, np.ndarray]] | None:
+    """``cv`` folds for one group, or None if the group is too short to split."""
+    try:
+        return list(cv.split(n_samples))
+    except ValueError:
+        return None
+
+
+def fit_pooled_elasticnet_ts_cv(
+    X_by_group: dict[str, np.ndarray],
+    y_by_group: dict[str, np.ndarray],
+    feature_names: list[str],
+    positive: bool,
+    standardize: bool,
+    cv: TimeSeriesCV,
+    param_grid: dict,
+    random_state: int = 42,
+) -> tuple[PooledFitResult, dict]:
+    """Grid search for a pooled ElasticNet with shared + per-group coefficients.
+
+    Each group is split with ``cv`` on its own timeline; fold ``k`` of the
+    pooled model is the union of every group's fold ``k``. Groups too short
+    for ``cv`` are never scored: all their rows are training rows in every
+    fold, so they still inform (and borrow from) the shared coefficients.
+    Selection uses the same ``(avg_mape, -avg_r2)`` rule as
+    ``fit_elasticnet_ts_cv``.
+
+    ``positive=True`` bounds the shared coefficients at zero; per-group
+    deviations stay free (see ``build_pooled_design(signed=True)``), so a
+    group's own coefficients can still come out negative. Those are listed in
+    ``PooledFitResult.negative_group_coefs``.
+    """
+    groups = list(X_by_group)
+    if not groups:
+        raise ValueError("No groups to fit.")
+    Xs = [np.asarray(X_by_group[g], dtype=float) for g in groups]
+    ys = [np.asarray(y_by_group[g], dtype=float) for g in groups]
+
+    folds = [_group_folds(cv, len(y)) for y in ys]
+    if all(f is None for f in folds):
+        raise ValueError("Not enough samples in any group for the requested CV splits.")
+
+    best = None
+    l1_ratios = param_grid.get("l1_ratio", [0.5])
+    alphas = param_grid.get("alpha", [0.1])
+
+    for l1 in l1_ratios:
+        for a in alphas:
+            fold_metrics = []
+            for k in range(cv.n_splits):
+                tr = [np.arange(len(y)) if f is None else f[k][0] for f, y in zip(folds, ys)]
+                te = [np.arange(0) if f is None else f[k][1] for f in folds]
+                m, stats = _fit_pooled(
+                    [X[i] for X, i in zip(Xs, tr)],
+                    [y[i] for y, i in zip(ys, tr)],
+                    a,
+                    l1,
+                    positive,
+                    standardize,
+                    random_state,
+                )
+                pred = np.concatenate(
+                    _predict_groups(m.coef_, stats, [X[i] for X, i in zip(Xs, te)], positive)
+                )
+                yte = np.concatenate([y[i] for y, i in zip(ys, te)])
+
+                fold_metrics.append(
+                    {
+                        "alpha": float(a),
+                        "l1_ratio": float(l1),
+                        "mape": float(mean_absolute_percentage_error(yte, pred)),
+                        "r2": float(r2_score(yte, pred)),
+                    }
+                )
+
+            avg_mape = float(np.mean([m["mape"] for m in fold_metrics]))
+            avg_r2 = float(np.mean([m["r2"] for m in fold_metrics]))
+            score = (avg_mape, -avg_r2)
+
+            if best is None or score < best[0]:
+                best = (score, fold_metrics, (a, l1))
+
+    assert best is not None
+    _, best_fold_metrics, (best_alpha, best_l1) = best
+    best_params = {"alpha": float(best_alpha), "l1_ratio": float(best_l1)}
+
+    # Refit on all rows of all groups with best params
+    model, stats = _fit_pooled(
+        Xs, ys, best_alpha, best_l1, positive, standardize, random_state
+    )
+    p = len(feature_names)
+    global_coef, group_coefs = _split_coef(model.coef_, p, len(groups), positive)
+
+    return (
+        PooledFitResult(
+            model=model,
+            groups=groups,
+            feature_names=list(feature_names),
+            stats=dict(zip(groups, stats)),
+            global_coef_=global_coef.copy(),
+            group_coef_={g: c.copy() for g, c in zip(groups, group_coefs)},
+            group_intercept_={
+                g: float(s.y_mean - s.x_mean @ c)
+                for g, s, c in zip(groups, stats, group_coefs)
+            },
+            metrics_by_fold=best_fold_metrics,
+            negative_group_coefs=[
+                (g, f)
+                for g, c in zip(groups, group_coefs)
+                for f, v in zip(feature_names, c)
+                if positive and v < 0
+            ],
+        ),
+        best_params,
+    )
+
+
+def decompose_pooled(
+    fit: PooledFitResult,
+    X_by_group: dict[str, np.ndarray],
+    date_by_group: dict[str, pd.Series] | None = None,
+) -> dict[str, ContributionResult]:
+    """Per-group ``decompose_linear`` outputs for a pooled fit."""
+    out = {}
+    for g in fit.groups:
+        out[g] = decompose_linear(
+            X=fit.stats[g].transform(np.asarray(X_by_group[g], dtype=float)),
+            feature_names=fit.feature_names,
+            coef=fit.group_coef_[g],
+            intercept=fit.group_intercept_[g],
+            date_index=None if date_by_group is None else date_by_group[g],
+        )
+    return out
@@ -19,6 +19,95 @@ class FitResult:
     metrics_by_fold: list[dict]
 
 
+def _make_model(alpha: float, l1_ratio: float, positive: bool, random_state: int) -> ElasticNet:
+    return ElasticNet(
+        alpha=float(alpha),
+        l1_ratio=float(l1_ratio),
+        fit_intercept=True,
+        positive=bool(positive),
+        max_iter=20000,
+        random_state=random_state,
+    )
+
+
+def _score_cell(
+    X: np.ndarray,
+    y: np.ndarray,
+    folds: list[tuple[np.ndarray, np.ndarray]],
+    alpha: float,
+    l1_ratio: float,
+    positive: bool,
+    standardize: bool,
+    random_state: int,
+    abandon=None,
+) -> list[dict] | None:
+    """CV metrics for one (alpha, l1_ratio) cell.
+
+    ``abandon(fold_metrics)`` is called after each fold; if it returns True the
+    cell is dropped and ``None`` is returned.
+    """
+    fold_metrics = []
+    for tr, te in folds:
+        Xtr, Xte = X[tr], X[te]
+        ytr, yte = y[tr], y[te]
+
+        scaler = None
+        if standardize:
+            scaler = StandardScaler()
+            Xtr = scaler.fit_transform(Xtr)
+            Xte = scaler.transform(Xte)
+
+        m = _make_model(alpha, l1_ratio, positive, random_state)
+        m.fit(Xtr, ytr)
+        pred = m.predict(Xte)
+
+        fold_metrics.append(
+            {
+                "alpha": float(alpha),
+                "l1_ratio": float(l1_ratio),
+                "mape": float(mean_absolute_percentage_error(yte, pred)),
+                "r2": float(r2_score(yte, pred)),
+            }
+        )
+        if abandon is not None and len(fold_metrics) < len(folds) and abandon(fold_metrics):
+            return None
+    return fold_metrics
+
+
+def _cell_score(fold_metrics: list[dict]) -> tuple[float, float]:
+    # choose by avg MAPE (lower is better); tie-break by higher R2
+    avg_mape = float(np.mean([m["mape"] for m in fold_metrics]))
+    avg_r2 = float(np.mean([m["r2"] for m in fold_metrics]))
+    return (avg_mape, -avg_r2)
+
+
+def _refit(
+    X: np.ndarray,
+    y: np.ndarray,
+    best_params: dict,
+    best_fold_metrics: list[dict],
+    positive: bool,
+    standardize: bool,
+) -> FitResult:
+    """Refit on full data with best params."""
+    scaler = None
+    Xfit = X
+    if standardize:
+        scaler = StandardScaler()
+        Xfit = scaler.fit_transform(Xfit)
+
+    model = _make_model(best_params["alpha"], best_params["l1_ratio"], positive, 42)
+    model.fit(Xfit, y)
+
+    return FitResult(
+        model=model,
+        scaler=scaler,
+        coef_=model.coef_.copy(),
+        intercept_=float(model.intercept_),
+        metrics_by_fold=best_fold_metrics,
+    )
+
+
 def fit_elasticnet_ts_cv(
     X: np.ndarray,
     y: np.ndarray,
@@ -34,48 +123,15 @@ def fit_elasticnet_ts_cv(
     TODO: consider switching to sklearn GridSearchCV with custom scorer
     """
     best = None
-    best_params = None
 
     l1_ratios = param_grid.get("l1_ratio", [0.5])
     alphas = param_grid.get("alpha", [0.1])
+    folds = list(cv.split(len(y)))
 
     for l1 in l1_ratios:
         for a in alphas:
-            fold_metrics = []
-            for tr, te in cv.split(len(y)):
-                Xtr, Xte = X[tr], X[te]
-                ytr, yte = y[tr], y[te]
-
-                scaler = None
-                if standardize:
-                    scaler = StandardScaler()
-                    Xtr = scaler.fit_transform(Xtr)
-                    Xte = scaler.transform(Xte)
-
-                m = ElasticNet(
-                    alpha=float(a),
-                    l1_ratio=float(l1),
-                    fit_intercept=True,
-                    positive=bool(positive),
-                    max_iter=20000,
-                    random_state=random_state,
-                )
-                m.fit(Xtr, ytr)
-                pred = m.predict(Xte)
-
-                fold_metrics.append(
-                    {
-                        "alpha": float(a),
-                        "l1_ratio": float(l1),
-                        "mape": float(mean_absolute_percentage_error(yte, pred)),
-                        "r2": float(r2_score(yte, pred)),
-                    }
-                )
-
-            # choose by avg MAPE (lower is better); tie-break by higher R2
-            avg_mape = float(np.mean([m["mape"] for m in fold_metrics]))
-            avg_r2 = float(np.mean([m["r2"] for m in fold_metrics]))
-            score = (avg_mape, -avg_r2)
+            fold_metrics = _score_cell(X, y, folds, a, l1, positive, standardize, random_state)
+            score = _cell_score(fold_metrics)
 
             if best is None or score < best[0]:
                 best = (score, fold_metrics, (a, l1))
@@ -84,33 +140,122 @@ def fit_elasticnet_ts_cv(
     _, best_fold_metrics, (best_alpha, best_l1) = best
     best_params = {"alpha": float(best_alpha), "l1_ratio": float(best_l1)}
 
-    # Refit on full data with best params
-    scaler = None
-    Xfit = X
-    if standardize:
-        scaler = StandardScaler()
-        Xfit = scaler.fit_transform(Xfit)
+    return _refit(X, y, best_params, best_fold_metrics, positive, standardize), best_params
 
-    model = ElasticNet(
-        alpha=best_params["alpha"],
-        l1_ratio=best_params["l1_ratio"],
-        fit_intercept=True,
-        positive=bool(positive),
-        max_iter=20000,
-        random_state=42,
-    )
-    model.fit(Xfit, y)
 
-    coef_ = model.coef_.copy()
-    intercept_ = float(model.intercept_)
-
-    return (
-        FitResult(
-            model=model,
-            scaler=scaler,
-            coef_=coef_,
-            intercept_=intercept_,
-            metrics_by_fold=best_fold_metrics,
-        ),
-        best_params,
-    )
+def fit_elasticnet_adaptive_ts_cv(
+    X: np.ndarray,
+    y: np.ndarray,
+    feature_names: list[str],
+    positive: bool,
+    standardize: bool,
+    cv: TimeSeriesCV,
+    param_grid: dict,
+    random_state: int = 42,
+    n_coarse: int = 3,
+    n_coarse_l1: int = 3,
+    max_rounds: int = 6,
+    tol: float = 1e-3,
+    min_alpha_step: float = 0.05,
+    prune_folds: int = 1,
+    prune_margin: float = 0.1,
+    refine_without_gain: bool = False,
+    max_fits: int | None = None,
+) -> tuple[FitResult, dict]:
+    """Coarse-to-fine search over ElasticNet hyperparams using time-series CV.
+
+    1. Coarse sweep: ``n_coarse`` log-spaced alphas x ``n_coarse_l1`` evenly
+       spaced l1 ratios spanning the ranges of ``param_grid`` (which stands in
+       for the grid; its own cells are not scored).
+    2. Refinement: score the four axis neighbours of the best cell (alpha step
+       in log10 space, l1 step linear), halving both steps each round. Stops
+       once a round improves the best avg MAPE by less than ``tol`` (relative),
+       after ``max_rounds``, or once the alpha step drops below
+       ``min_alpha_step`` decades. With ``refine_without_gain=True`` a round
+       with no improvement at all only shrinks the steps instead of stopping.
+
+    The search never starts a cell that could take it past ``max_fits`` fold
+    fits (default: one fewer than the grid's cells x folds), so it costs less
+    than ``search: grid`` for any grid of two or more cells.
+
+    Every cell after the first is abandoned once its mean MAPE over the first
+    ``prune_folds`` folds (or more) exceeds the incumbent's mean on the same
+    folds by more than ``prune_margin`` (relative). Only fully scored cells
+    can win, and the winner is picked with the same ``(avg_mape, -avg_r2)``
+    rule as the grid.
+    """
+    alpha_vals = [float(a) for a in param_grid.get("alpha", [0.1])]
+    l1_vals = [float(v) for v in param_grid.get("l1_ratio", [0.5])]
+    lo, hi = np.log10(min(alpha_vals)), np.log10(max(alpha_vals))
+    l1_lo, l1_hi = min(l1_vals), max(l1_vals)
+    folds = list(cv.split(len(y)))
+    if max_fits is None:
+        max_fits = len(alpha_vals) * len(l1_vals) * len(folds) - 1
+
+    scored: dict[tuple[float, float], list[dict] | None] = {}
+    best = None  # (score, fold_metrics, (alpha, l1))
+    n_fits = 0
+
+    def abandon(fold_metrics: list[dict]) -> bool:
+        nonlocal n_fits
+        k = len(fold_metrics)
+        n_fits += 1
+        if best is None or k < prune_folds:
+            return False
+        inc = np.mean([m["mape"] for m in best[1][:k]])
+        cur = np.mean([m["mape"] for m in fold_metrics])
+        return bool(cur > inc * (1.0 + prune_margin))
+
+    def evaluate(cells) -> bool:
+        """Score ``cells``; False once the fit budget is exhausted."""
+        nonlocal best, n_fits
+        for a, l1 in cells:
+            key = (round(float(a), 12), round(float(l1), 12))
+            if key in scored:
+                continue
+            if best is not None and n_fits + len(folds) > max_fits:
+                return False
+            fm = _score_cell(X, y, folds, key[0], key[1], positive, standardize, random_state, abandon)
+            scored[key] = fm
+            if fm is None:
+                continue
+            n_fits += 1  # abandon() counts every fold but the last
+            score = _cell_score(fm)
+            if best is None or score < best[0]:
+                best = (score, fm, key)
+        return True
+
+    n_a = max(n_coarse, 1) if hi > lo else 1
+    n_l1 = max(n_coarse_l1, 1) if l1_hi > l1_lo else 1
+    coarse_alphas = np.logspace(lo, hi, n_a)
+    coarse_l1 = np.linspace(l1_lo, l1_hi, n_l1)
+    evaluate((a, l1) for l1 in coarse_l1 for a in coarse_alphas)
+
+    a_step = (hi - lo) / (n_a - 1) if n_a > 1 else 1.0
+    l1_step = (l1_hi - l1_lo) / (n_l1 - 1) if n_l1 > 1 else 0.0
+
+    for _ in range(max_rounds):
+        assert best is not None
+        prev_mape = best[0][0]
+        a_step /= 2.0
+        l1_step /= 2.0
+        if a_step < min_alpha_step:
+            break
+        a0, l10 = best[2]
+        la0 = np.log10(a0)
+        cells = [(10 ** (la0 - a_step), l10), (10 ** (la0 + a_step), l10)]
+        if l1_step > 0:
+            cells += [(a0, float(np.clip(l10 + dl, 0.01, 1.0))) for dl in (-l1_step, l1_step)]
+        if not evaluate(cells):
+            break
+        gain = prev_mape - best[0][0]
+        if refine_without_gain and gain <= 0:
+            continue
+        if gain < tol * max(abs(prev_mape), 1e-12):
+            break
+
+    assert best is not None
+    _, best_fold_metrics, (best_alpha, best_l1) = best
+    best_params = {"alpha": float(best_alpha), "l1_ratio": float(best_l1)}
+
+    return _refit(X, y, best_params, best_fold_metrics, positive, standardize), best_params
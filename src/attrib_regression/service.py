@@ -0,0 +1,399 @@
+"""Long-lived local job service for attribution runs.
+
+Keeps the package imported and datasets / fitted models cached inside warm
+worker processes, so repeated pipeline, score and scenario requests skip the
+cold start of spawning ``rba-pipeline`` per call.
+
+HTTP interface (JSON in, JSON out; one request per connection):
+
+    GET  /health         -> queue depth and worker count
+    POST /jobs           -> {"kind": "pipeline" | "score" | "scenario", "params": {...}}
+    GET  /jobs           -> status of all known jobs
+    GET  /jobs/<id>      -> status (and result once done) of one job
+
+``POST /jobs`` answers 503 when the queue is full (backpressure).
+
+There is no authentication: the service binds to loopback only unless
+``--allow-remote`` is given, and ``score`` outputs are confined to the
+config's ``outputs.reports_dir``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import ipaddress
+import json
+import time
+import traceback
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from attrib_regression.cli import fit_single, load_data, run_pipeline, transform_features
+from attrib_regression.config import load_rba_config
+from attrib_regression.features.build_matrix import build_xy
+
+JOB_KINDS = ("pipeline", "score", "scenario")
+
+
+# --- worker side: runs in pool processes; caches live as long as the worker ---
+
+_CACHE_SIZE = 4  # entries per cache, per worker (LRU)
+_DATA_CACHE: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+_FIT_CACHE: OrderedDict[tuple, tuple] = OrderedDict()
+
+
+def _file_key(path: str | Path) -> tuple[str, float]:
+    p = Path(path).resolve()
+    return str(p), p.stat().st_mtime
+
+
+def _cached(cache: OrderedDict, ident: tuple, version: tuple, build):
+    """LRU lookup keyed by ``(ident, version)``.
+
+    A new version (e.g. an edited file) replaces older versions of the same
+    ``ident`` instead of accumulating next to them.
+    """
+    key = (ident, version)
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+    for stale in [k for k in cache if k[0] == ident]:
+        del cache[stale]
+    value = build()
+    cache[key] = value
+    while len(cache) > _CACHE_SIZE:
+        cache.popitem(last=False)
+    return value
+
+
+def _cached_data(cfg) -> pd.DataFrame:
+    path, mtime = _file_key(cfg.data.path)
+    # everything load_data depends on besides the file itself
+    ident = (
+        path,
+        cfg.data.date_col,
+        cfg.data.target_col,
+        tuple(cfg.variables.media_spend_cols + cfg.variables.control_cols),
+    )
+    return _cached(_DATA_CACHE, ident, (mtime,), lambda: load_data(cfg))
+
+
+def _cached_fit(cfg, config_path: str):
+    if getattr(cfg.data, "group_col", None) and getattr(cfg.model, "pooled", False):
+        raise ValueError("score/scenario jobs support single-model configs only")
+    cfg_path, cfg_mtime = _file_key(config_path)
+    data_path, data_mtime = _file_key(cfg.data.path)
+    return _cached(
+        _FIT_CACHE,
+        (cfg_path, data_path),
+        (cfg_mtime, data_mtime),
+        lambda: fit_single(cfg, _cached_data(cfg)),
+    )
+
+
+def _config_with_data(config_path: str, data_path: str):
+    """Load a config and point ``data.path`` at another file (e.g. a scoring set)."""
+    cfg = load_rba_config(config_path)
+    cfg.data.path = data_path
+    return cfg
+
+
+def _output_path(cfg, name: str) -> Path:
+    """Resolve a client-supplied output path; it must stay inside ``outputs.reports_dir``."""
+    root = Path(cfg.outputs.reports_dir).resolve()
+    path = (root / name).resolve()
+    if not path.is_relative_to(root):
+        raise ValueError(f"params.output must be a path inside outputs.reports_dir ({root})")
+    return path
+
+
+def _predict(cfg, fit, df: pd.DataFrame) -> np.ndarray:
+    """Predict on the target scale for a cleaned (untransformed) frame."""
+    d, feature_cols = transform_features(df, cfg)
+    X = build_xy(
+        d,
+        target_col=cfg.data.target_col,
+        feature_cols=feature_cols,
+        target_transform=cfg.model.target_transform,
+        feature_transform=cfg.model.feature_transform,
+    ).X
+    if fit.scaler is not None:
+        X = fit.scaler.transform(X)
+    pred = fit.model.predict(X)
+    if cfg.model.target_transform == "log1p":
+        pred = np.expm1(pred)
+    return pred
+
+
+def _job_pipeline(cfg, config_path: str, params: dict) -> dict:
+    return run_pipeline(cfg, config_path, df=_cached_data(cfg))
+
+
+def _job_score(cfg, config_path: str, params: dict) -> dict:
+    """Predict on the config's data or ``params["data"]``.
+
+    ``params["output"]`` (relative to ``outputs.reports_dir``) writes a CSV
+    instead of returning the predictions inline.
+    """
+    _, _, fit, best_params = _cached_fit(cfg, config_path)
+    if params.get("data"):
+        df = load_data(_config_with_data(config_path, params["data"]))
+    else:
+        df = _cached_data(cfg)
+    pred = _predict(cfg, fit, df)
+
+    out = {"best_params": best_params, "n_rows": int(len(pred)), "total_pred": float(pred.sum())}
+    if params.get("output"):
+        out_path = _output_path(cfg, params["output"])
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame({cfg.data.date_col: df[cfg.data.date_col], "pred": pred}).to_csv(out_path, index=False)
+        out["output"] = str(out_path)
+    else:
+        out["pred"] = pred.tolist()
+    return out
+
+
+def _job_scenario(cfg, config_path: str, params: dict) -> dict:
+    """Re-score the history with spend columns scaled by ``params["multipliers"]``."""
+    multipliers = params.get("multipliers") or {}
+    unknown = [c for c in multipliers if c not in cfg.variables.media_spend_cols]
+    if unknown:
+        raise ValueError(f"Unknown media columns in multipliers: {unknown}")
+
+    _, _, fit, _ = _cached_fit(cfg, config_path)
+    df = _cached_data(cfg)
+    scen = df.copy()
+    for c, m in multipliers.items():
+        scen[c] = scen[c].astype(float) * float(m)
+
+    base_total = float(_predict(cfg, fit, df).sum())
+    scen_total = float(_predict(cfg, fit, scen).sum())
+    return {
+        "multipliers": {c: float(m) for c, m in multipliers.items()},
+        "baseline_total": base_total,
+        "scenario_total": scen_total,
+        "delta": scen_total - base_total,
+    }
+
+
+_JOB_FUNCS = {
+    "pipeline": _job_pipeline,
+    "score": _job_score,
+    "scenario": _job_scenario,
+}
+
+
+def run_job(kind: str, params: dict) -> dict:
+    """Execute one job in the current process. Must stay picklable (pool target)."""
+    if kind not in _JOB_FUNCS:
+        raise ValueError(f"Unknown job kind: {kind!r} (expected one of {JOB_KINDS})")
+    config_path = params.get("config")
+    if not config_path:
+        raise ValueError("params.config is required")
+    cfg = load_rba_config(config_path)
+    return _JOB_FUNCS[kind](cfg, config_path, params)
+
+
+# --- server side ---
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    params: dict
+    status: str = "queued"  # queued | running | done | failed
+    submitted_at: float = 0.0
+    started_at: float | None = None
+    finished_at: float | None = None
+    result: dict | None = None
+    error: str | None = None
+
+
+class JobService:
+    """Bounded job queue drained by ``max_workers`` dispatchers onto a process pool."""
+
+    def __init__(self, max_workers: int = 2, queue_size: int = 32, max_history: int = 1000):
+        self.max_workers = max_workers
+        self.max_history = max_history
+        self.queue: asyncio.Queue[Job] = asyncio.Queue(maxsize=queue_size)
+        self.jobs: dict[str, Job] = {}
+        self._pool: ProcessPoolExecutor | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        self._tasks = [asyncio.create_task(self._dispatch()) for _ in range(self.max_workers)]
+
+    async def close(self) -> None:
+        for t in self._tasks:
+            t.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def submit(self, kind: str, params: dict) -> Job:
+        """Enqueue a job. Raises ``asyncio.QueueFull`` when the queue is at capacity."""
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind: {kind!r} (expected one of {JOB_KINDS})")
+        job = Job(id=uuid.uuid4().hex[:12], kind=kind, params=params, submitted_at=time.time())
+        self.queue.put_nowait(job)
+        self.jobs[job.id] = job
+        self._prune()
+        return job
+
+    def _prune(self) -> None:
+        finished = [j for j in self.jobs.values() if j.status in ("done", "failed")]
+        for j in finished[: max(0, len(self.jobs) - self.max_history)]:
+            del self.jobs[j.id]
+
+    async def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self.queue.get()
+            job.status = "running"
+            job.started_at = time.time()
+            try:
+                job.result = await loop.run_in_executor(self._pool, run_job, job.kind, job.params)
+                job.status = "done"
+            except Exception as e:  # surface the failure on the job, keep serving
+                job.status = "failed"
+                job.error = "".join(traceback.format_exception_only(type(e), e)).strip()
+            finally:
+                job.finished_at = time.time()
+                self.queue.task_done()
+
+    # --- minimal HTTP/1.1 handling ---
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            status, payload = await self._route(reader)
+        except Exception as e:
+            status, payload = 400, {"error": str(e)}
+        body = json.dumps(payload).encode("utf-8")
+        reason = {200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found", 503: "Service Unavailable"}
+        head = (
+            f"HTTP/1.1 {status} {reason.get(status, '')}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(head.encode("ascii") + body)
+        await writer.drain()
+        writer.close()
+
+    async def _route(self, reader: asyncio.StreamReader) -> tuple[int, Any]:
+        request_line = (await reader.readline()).decode("ascii").strip()
+        method, path, _ = request_line.split(" ", 2)
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            k, _, v = line.partition(":")
+            headers[k.strip().lower()] = v.strip()
+        length = int(headers.get("content-length", 0))
+        body = await reader.readexactly(length) if length else b""
+
+        if method == "GET" and path == "/health":
+            return 200, {"ok": True, "queued": self.queue.qsize(), "workers": self.max_workers}
+        if method == "GET" and path == "/jobs":
+            return 200, [_job_summary(j) for j in self.jobs.values()]
+        if method == "GET" and path.startswith("/jobs/"):
+            job = self.jobs.get(path[len("/jobs/") :])
+            if job is None:
+                return 404, {"error": "unknown job"}
+            return 200, asdict(job)
+        if method == "POST" and path == "/jobs":
+            req = json.loads(body or b"{}")
+            try:
+                job = self.submit(req.get("kind", ""), req.get("params") or {})
+            except asyncio.QueueFull:
+                return 503, {"error": "queue full", "queued": self.queue.qsize()}
+            return 202, {"id": job.id, "status": job.status}
+        return 404, {"error": f"no route for {method} {path}"}
+
+
+def _job_summary(job: Job) -> dict:
+    return {"id": job.id, "kind": job.kind, "status": job.status, "error": job.error}
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+async def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: str | None = None,
+    max_workers: int = 2,
+    queue_size: int = 32,
+    allow_remote: bool = False,
+) -> None:
+    if not socket_path and not allow_remote and not _is_loopback(host):
+        raise ValueError(
+            f"Refusing to bind unauthenticated service to non-loopback host {host!r}; "
+            "pass --allow-remote to override."
+        )
+    service = JobService(max_workers=max_workers, queue_size=queue_size)
+    await service.start()
+    if socket_path:
+        server = await asyncio.start_unix_server(service.handle, path=socket_path)
+        where = socket_path
+    else:
+        server = await asyncio.start_server(service.handle, host=host, port=port)
+        where = f"http://{host}:{port}"
+    print("rba-service listening on", where)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+        if socket_path:
+            Path(socket_path).unlink(missing_ok=True)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--socket", default=None, help="Serve on a Unix socket instead of TCP")
+    ap.add_argument("--workers", type=int, default=2, help="Worker processes")
+    ap.add_argument("--queue-size", type=int, default=32, help="Max queued jobs before 503")
+    ap.add_argument(
+        "--allow-remote",
+        action="store_true",
+        help="Allow binding to a non-loopback host (the service has no authentication)",
+    )
+    args = ap.parse_args()
+
+    try:
+        asyncio.run(
+            serve(
+                host=args.host,
+                port=args.port,
+                socket_path=args.socket,
+                max_workers=args.workers,
+                queue_size=args.queue_size,
+                allow_remote=args.allow_remote,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
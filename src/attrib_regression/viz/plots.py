@@ -1,25 +1,88 @@
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+
+# Figures are built with the object-oriented API (``Figure`` directly, not
+# ``plt.figure``) so they never enter pyplot's global registry: nothing to leak,
+# no GUI backend needed, safe in worker processes. Notebooks display the
+# returned Figure as usual.
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices kept by Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points and, from each of ``n_out - 2`` buckets,
+    the point forming the largest triangle with the previously kept point and
+    the next bucket's mean. Preserves peaks far better than striding.
+    ``x`` may be numeric or datetime64. Returns all indices when ``n_out``
+    does not reduce the series.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    xn = x.astype("datetime64[ns]").astype(np.int64).astype(float) if np.issubdtype(x.dtype, np.datetime64) else x.astype(float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)  # n_out - 2 buckets over the interior
+
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+        nlo, nhi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        cx, cy = (xn[nlo:nhi].mean(), y[nlo:nhi].mean()) if nhi > nlo else (xn[-1], y[-1])
+        area = np.abs((xn[a] - cx) * (y[lo:hi] - y[a]) - (xn[a] - xn[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> tuple[np.ndarray, np.ndarray]:
+    """LTTB-downsample ``(x, y)`` to ``n_out`` points (see ``lttb_indices``)."""
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    keep = lttb_indices(x, y, n_out)
+    return x[keep], y[keep]
 
 
 def plot_actual_vs_pred(
-    dates: pd.Series, actual: pd.Series, pred: pd.Series, title: str = "Actual vs Pred"
-) -> None:
-    plt.figure()
-    plt.plot(dates, actual, label="actual")
-    plt.plot(dates, pred, label="pred")
-    plt.title(title)
-    plt.legend()
-    plt.tight_layout()
+    dates: pd.Series,
+    actual: pd.Series,
+    pred: pd.Series,
+    title: str = "Actual vs Pred",
+    max_points: int | None = None,
+    ax: Axes | None = None,
+) -> Figure:
+    """Line chart of actual vs predicted; long series are LTTB-downsampled to ``max_points``.
+
+    The kept points are chosen once, from ``actual``, and used for both lines
+    so they stay comparable point for point.
+    """
+    fig = ax.figure if ax is not None else Figure()
+    ax = ax if ax is not None else fig.add_subplot()
+    x = np.asarray(dates)
+    keep = np.arange(len(x)) if max_points is None else lttb_indices(x, actual, max_points)
+    for values, label in ((actual, "actual"), (pred, "pred")):
+        ax.plot(x[keep], np.asarray(values)[keep], label=label)
+    ax.set_title(title)
+    ax.legend()
+    fig.autofmt_xdate()
+    fig.tight_layout()
+    return fig
 
 
 def plot_contrib_share(
-    contrib_totals: pd.Series, title: str = "Contribution Share"
-) -> None:
+    contrib_totals: pd.Series, title: str = "Contribution Share", ax: Axes | None = None
+) -> Figure:
     s = contrib_totals.copy()
     s = s[s.index != "intercept"]
     s = s.sort_values(ascending=False)
-    plt.figure()
-    (s / s.sum()).plot(kind="bar")
-    plt.title(title)
-    plt.tight_layout()
+    fig = ax.figure if ax is not None else Figure()
+    ax = ax if ax is not None else fig.add_subplot()
+    (s / s.sum()).plot(kind="bar", ax=ax)
+    ax.set_title(title)
+    fig.tight_layout()
+    return fig
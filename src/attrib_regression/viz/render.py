@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .plots import plot_actual_vs_pred, plot_contrib_share
+
+
+@dataclass
+class FigureJob:
+    """Everything needed to draw one group's figures (plain data, picklable)."""
+
+    name: str
+    dates: np.ndarray
+    actual: np.ndarray
+    pred: np.ndarray
+    totals: pd.Series
+
+
+def _init_worker() -> None:
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _render_one(job: FigureJob, out_dir: str, max_points: int | None, fmt: str) -> list[str]:
+    out = Path(out_dir)
+    paths = []
+    for stem, draw in (
+        ("actual_vs_pred", lambda: plot_actual_vs_pred(job.dates, job.actual, job.pred, title=f"{job.name}: actual vs pred", max_points=max_points)),
+        ("contrib_share", lambda: plot_contrib_share(job.totals, title=f"{job.name}: contribution share")),
+    ):
+        fig = draw()
+        try:
+            path = out / f"{stem}_{job.name}.{fmt}"
+            fig.savefig(path)
+            paths.append(str(path))
+        finally:
+            fig.clear()  # release artists now rather than at GC
+    return paths
+
+
+def render_figures(
+    jobs: list[FigureJob],
+    out_dir: str | Path,
+    max_points: int | None = 2000,
+    max_workers: int | None = None,
+    fmt: str = "png",
+) -> list[Path]:
+    """Render figures for many groups headlessly, in parallel when worthwhile.
+
+    Returns the written paths (group order preserved).
+    """
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    if not jobs:
+        return []
+
+    if len(jobs) == 1 or max_workers == 1:
+        # OO figures need no backend in-process; leave the caller's backend alone
+        nested = [_render_one(j, str(out), max_points, fmt) for j in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as pool:
+            futures = [pool.submit(_render_one, j, str(out), max_points, fmt) for j in jobs]
+            nested = [f.result() for f in futures]
+    return [Path(p) for paths in nested for p in paths]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from attrib_regression.eval.backtest import rolling_origin_backtest, rolling_origins
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0, 1, size=(60, 2))
+    y = 10.0 + X @ np.array([4.0, 1.0]) + rng.normal(0, 0.1, 60)
+    return X, y
+
+
+def test_rolling_origins():
+    assert rolling_origins(20, min_train=10, step=4, horizon=4) == [10, 14, 18]
+
+
+def test_rolling_origins_too_short():
+    with pytest.raises(ValueError, match="Not enough samples"):
+        rolling_origins(10, min_train=10, step=1, horizon=1)
+
+
+def test_backtest_is_out_of_sample_and_decomposes(data):
+    X, y = data
+    dates = pd.Series(pd.date_range("2025-01-01", periods=60))
+    res = rolling_origin_backtest(
+        X, y, ["a", "b"], {"alpha": 0.001, "l1_ratio": 0.5}, True, True,
+        min_train=30, step=10, horizon=10, date_index=dates,
+    )
+    assert list(res.metrics["origin"]) == [30, 40, 50]
+    assert (res.predictions["row"] >= res.predictions["origin"]).all()
+    assert len(res.predictions) == len(res.contributions) == 30
+    row_sums = res.contributions[["a", "b", "intercept"]].sum(axis=1).to_numpy()
+    np.testing.assert_allclose(row_sums, res.predictions["pred"].to_numpy())
+
+
+def test_incremental_scaler_matches_full_refit(data):
+    from sklearn.linear_model import ElasticNet
+    from sklearn.preprocessing import StandardScaler
+
+    X, y = data
+    res = rolling_origin_backtest(
+        X, y, ["a", "b"], {"alpha": 0.001, "l1_ratio": 0.5}, False, True,
+        min_train=30, step=10, horizon=10,
+    )
+    # last origin, refit from scratch
+    sc = StandardScaler().fit(X[:50])
+    m = ElasticNet(alpha=0.001, l1_ratio=0.5, max_iter=20000).fit(sc.transform(X[:50]), y[:50])
+    expected = m.predict(sc.transform(X[50:]))
+    got = res.predictions.loc[res.predictions["origin"] == 50, "pred"].to_numpy()
+    np.testing.assert_allclose(got, expected, rtol=1e-4)
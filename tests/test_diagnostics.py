@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import statsmodels.api as sm
+
+from attrib_regression.models.diagnostics import fit_diagnostics, ols_refit, vif
+
+
+def _auxiliary_vif(X: np.ndarray, j: int) -> float:
+    others = np.delete(X, j, axis=1)
+    r2 = sm.OLS(X[:, j], sm.add_constant(others)).fit().rsquared
+    return 1.0 / (1.0 - r2)
+
+
+def test_vif_matches_auxiliary_regressions():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 4))
+    X[:, 3] = X[:, 0] + 0.5 * X[:, 1] + rng.normal(scale=0.3, size=200)
+    result = vif(X)
+    expected = [_auxiliary_vif(X, j) for j in range(4)]
+    np.testing.assert_allclose(result, expected, rtol=1e-8)
+
+
+def test_vif_exact_collinearity_is_inf():
+    rng = np.random.default_rng(4)
+    X = rng.normal(size=(300, 4))
+    X[:, 2] = X[:, 0] + X[:, 1]
+    X[:, 3] = 0.7 * X[:, 0] + rng.normal(size=300)
+    result = vif(X)
+    assert np.all(np.isinf(result[:3]))
+    assert result[3] == pytest.approx(_auxiliary_vif(X[:, [0, 1, 3]], 2), rel=1e-8)
+
+
+def test_vif_constant_column_is_nan():
+    rng = np.random.default_rng(1)
+    X = np.column_stack([rng.normal(size=50), np.ones(50), rng.normal(size=50)])
+    result = vif(X)
+    assert np.isnan(result[1])
+    assert np.all(np.isfinite(result[[0, 2]]))
+
+
+def test_ols_refit_only_on_support():
+    rng = np.random.default_rng(2)
+    X = rng.normal(size=(100, 3))
+    y = 2.0 * X[:, 0] + rng.normal(scale=0.1, size=100)
+    out = ols_refit(X, y, ["a", "b", "c"], np.array([1.5, 0.0, 0.2]))
+    assert np.isnan(out.loc[1, "ols_se"])
+    assert out.loc[0, "ols_coef"] == pytest.approx(2.0, abs=0.05)
+
+
+def test_fit_diagnostics_outputs():
+    rng = np.random.default_rng(3)
+    X = rng.normal(size=(60, 2))
+    coef = np.array([1.0, 0.5])
+    y = X @ coef + 3.0 + rng.normal(scale=0.1, size=60)
+    coef_diag, fit_diag = fit_diagnostics(X, y, ["a", "b"], coef, 3.0)
+    assert list(coef_diag.columns[:3]) == ["feature", "coef", "vif"]
+    metrics = dict(zip(fit_diag["metric"], fit_diag["value"]))
+    assert 0.0 < metrics["durbin_watson"] < 4.0
+    assert "ljung_box_pvalue" in metrics
+    assert "breusch_pagan_pvalue" in metrics
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from attrib_regression.viz.plots import lttb, plot_actual_vs_pred
+from attrib_regression.viz.render import FigureJob, render_figures
+
+
+def test_lttb_keeps_endpoints_and_peak():
+    x = np.arange(1000)
+    y = np.zeros(1000)
+    y[437] = 50.0
+    xs, ys = lttb(x, y, 20)
+    assert len(xs) == 20
+    assert xs[0] == 0 and xs[-1] == 999
+    assert ys.max() == 50.0
+    assert np.all(np.diff(xs) > 0)
+
+
+def test_lttb_short_series_untouched():
+    x = np.arange(5)
+    y = np.arange(5.0)
+    xs, ys = lttb(x, y, 10)
+    np.testing.assert_array_equal(xs, x)
+
+
+def test_lttb_datetime_axis():
+    dates = np.arange("2024-01-01", "2025-01-01", dtype="datetime64[D]")
+    xs, _ = lttb(dates, np.arange(len(dates), dtype=float), 30)
+    assert xs.dtype == dates.dtype
+    assert len(xs) == 30
+
+
+def test_plot_downsamples_lines():
+    dates = pd.Series(pd.date_range("2024-01-01", periods=500))
+    fig = plot_actual_vs_pred(dates, np.arange(500.0), np.arange(500.0), max_points=50)
+    assert all(len(line.get_xdata()) == 50 for line in fig.axes[0].get_lines())
+
+
+def test_plot_uses_same_points_for_both_lines():
+    dates = pd.Series(pd.date_range("2024-01-01", periods=500))
+    actual = np.zeros(500)
+    actual[100] = 10.0
+    pred = np.zeros(500)
+    pred[300] = 10.0  # a peak only in pred must not pull the lines onto different x points
+    fig = plot_actual_vs_pred(dates, actual, pred, max_points=20)
+    line_a, line_p = fig.axes[0].get_lines()
+    np.testing.assert_array_equal(line_a.get_xdata(), line_p.get_xdata())
+    assert line_a.get_ydata().max() == 10.0
+
+
+def test_render_figures_writes_files(tmp_path):
+    dates = pd.date_range("2024-01-01", periods=30).to_numpy()
+    totals = pd.Series({"a": 3.0, "b": 1.0, "intercept": 5.0})
+    jobs = [
+        FigureJob(name=g, dates=dates, actual=np.arange(30.0), pred=np.arange(30.0), totals=totals)
+        for g in ["east", "west"]
+    ]
+    paths = render_figures(jobs, tmp_path, max_points=10, max_workers=2)
+    assert len(paths) == 4
+    assert all(p.exists() and p.stat().st_size > 0 for p in paths)
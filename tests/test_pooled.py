@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from attrib_regression.eval.tscv import TimeSeriesCV
+from attrib_regression.models.pooled import (
+    build_pooled_design,
+    decompose_pooled,
+    fit_pooled_elasticnet_ts_cv,
+)
+
+
+def _panel(seed: int = 0):
+    rng = np.random.default_rng(seed)
+    X_by_group, y_by_group = {}, {}
+    for g, lift in [("a", 0.0), ("b", 1.0), ("c", 2.0)]:
+        X = rng.uniform(0, 1, size=(40, 2))
+        X_by_group[g] = X
+        y_by_group[g] = 10.0 + X @ np.array([3.0 + lift, 1.0]) + rng.normal(0, 0.01, 40)
+    return X_by_group, y_by_group
+
+
+def test_pooled_design_shape_and_blocks():
+    a = np.ones((2, 3))
+    b = 2 * np.ones((4, 3))
+    D = build_pooled_design([a, b])
+    assert D.shape == (6, 3 * 3)
+    dense = D.toarray()
+    np.testing.assert_array_equal(dense[:, :3], np.vstack([a, b]))
+    np.testing.assert_array_equal(dense[:2, 3:6], a)
+    np.testing.assert_array_equal(dense[2:, 6:9], b)
+    assert dense[:2, 6:].sum() == 0
+    assert dense[2:, 3:6].sum() == 0
+
+
+def test_pooled_fit_recovers_group_lift():
+    X_by_group, y_by_group = _panel()
+    cv = TimeSeriesCV(n_splits=2, test_size=5)
+    fit, params = fit_pooled_elasticnet_ts_cv(
+        X_by_group,
+        y_by_group,
+        ["x1", "x2"],
+        positive=False,
+        standardize=False,
+        cv=cv,
+        param_grid={"l1_ratio": [0.5], "alpha": [1e-5]},
+    )
+    assert params == {"alpha": 1e-5, "l1_ratio": 0.5}
+    assert len(fit.metrics_by_fold) == 2
+    coef_a = fit.group_coef_["a"][0]
+    coef_c = fit.group_coef_["c"][0]
+    assert coef_c - coef_a == pytest.approx(2.0, abs=0.1)
+
+
+def test_decompose_pooled_sums_to_prediction():
+    X_by_group, y_by_group = _panel(1)
+    cv = TimeSeriesCV(n_splits=2, test_size=5)
+    fit, _ = fit_pooled_elasticnet_ts_cv(
+        X_by_group,
+        y_by_group,
+        ["x1", "x2"],
+        positive=False,
+        standardize=True,
+        cv=cv,
+        param_grid={"l1_ratio": [0.5], "alpha": [0.01]},
+    )
+    contribs = decompose_pooled(fit, X_by_group)
+    for g, res in contribs.items():
+        stats = fit.stats[g]
+        pred = (stats.transform(X_by_group[g]) - stats.x_mean) @ fit.group_coef_[g] + stats.y_mean
+        np.testing.assert_allclose(res.contributions.sum(axis=1).values, pred)
+
+
+
+def test_signed_pooled_design_appends_negated_deviations():
+    a = np.ones((2, 3))
+    b = 2 * np.ones((4, 3))
+    dense = build_pooled_design([a, b], signed=True).toarray()
+    assert dense.shape == (6, 3 * 5)
+    np.testing.assert_array_equal(dense[:, 9:], -dense[:, 3:9])
+
+
+def test_pooled_positive_bounds_shared_coefs_only():
+    X_by_group, y_by_group = _panel()
+    # group "a" responds negatively to x1: only a negative deviation can fit it
+    y_by_group["a"] = y_by_group["a"] - 4.0 * X_by_group["a"][:, 0]
+    fit, _ = fit_pooled_elasticnet_ts_cv(
+        X_by_group,
+        y_by_group,
+        ["x1", "x2"],
+        positive=True,
+        standardize=False,
+        cv=TimeSeriesCV(n_splits=2, test_size=5),
+        param_grid={"l1_ratio": [0.5], "alpha": [1e-5]},
+    )
+    assert (fit.global_coef_ >= 0).all()
+    assert fit.group_coef_["a"][0] == pytest.approx(-1.0, abs=0.1)
+    assert fit.group_coef_["c"][0] == pytest.approx(5.0, abs=0.1)
+    assert fit.negative_group_coefs == [("a", "x1")]
+
+
+def test_short_group_is_train_only():
+    X_by_group, y_by_group = _panel()
+    X_by_group["tiny"] = X_by_group["a"][:6]
+    y_by_group["tiny"] = y_by_group["a"][:6]
+    fit, _ = fit_pooled_elasticnet_ts_cv(
+        X_by_group,
+        y_by_group,
+        ["x1", "x2"],
+        positive=False,
+        standardize=False,
+        cv=TimeSeriesCV(n_splits=2, test_size=5),
+        param_grid={"l1_ratio": [0.5], "alpha": [1e-5]},
+    )
+    assert "tiny" in fit.group_coef_
+    assert len(fit.metrics_by_fold) == 2
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from attrib_regression.attribution.response import (
+    ResponseCurves,
+    build_response_curves,
+    channel_response,
+)
+from attrib_regression.features.adstock import adstock_series
+from attrib_regression.features.saturation import hill
+
+
+@pytest.fixture
+def curves():
+    return build_response_curves(
+        ["a", "b"],
+        coef=np.array([2.0, 0.5]),
+        spend_max=np.array([10.0, 100.0]),
+        alphas={"a": 0.5, "b": 0.2},
+        hill_params={"a": (4.0, 1.5), "b": (50.0, 1.0)},
+        scaler_scale=np.array([0.3, 0.2]),
+        n_points=256,
+    )
+
+
+def test_channel_response_matches_long_run_feature_chain():
+    spend, alpha, ec50, slope, coef, scale = 3.0, 0.6, 5.0, 1.2, 1.7, 0.4
+    x = adstock_series(np.full(200, spend), alpha=alpha, max_lag=26)
+    expected = coef / scale * (hill(x[-1:], ec50, slope) - hill(np.zeros(1), ec50, slope))
+    got = channel_response(np.array([spend]), coef, alpha, ec50, slope, scaler_scale=scale)
+    np.testing.assert_allclose(got, expected, rtol=1e-9)
+
+
+def test_zero_spend_is_zero(curves):
+    np.testing.assert_allclose(curves.response[:, 0], 0.0, atol=1e-12)
+
+
+def test_lookup_matches_np_interp(curves):
+    rng = np.random.default_rng(0)
+    spend = rng.uniform(0, 100, 500)
+    got = curves.lookup("b", spend)
+    expected = np.interp(spend, curves.spend_grid("b"), curves.response[1])
+    np.testing.assert_allclose(got, expected, rtol=1e-10)
+
+
+def test_lookup_mixed_channels_and_clamp(curves):
+    got = curves.lookup(["a", "b", "a"], [5.0, 50.0, 1e9])
+    assert got[0] == pytest.approx(np.interp(5.0, curves.spend_grid("a"), curves.response[0]))
+    assert got[1] == pytest.approx(np.interp(50.0, curves.spend_grid("b"), curves.response[1]))
+    assert got[2] == pytest.approx(curves.response[0, -1])
+
+
+def test_lookup_non_finite_spend_is_nan(curves):
+    got = curves.lookup(["a", "b", "a", "b"], [np.nan, 50.0, np.inf, -np.inf])
+    assert np.isnan(got[[0, 2, 3]]).all()
+    assert got[1] == pytest.approx(np.interp(50.0, curves.spend_grid("b"), curves.response[1]))
+
+
+def test_marginal_is_derivative(curves):
+    s = curves.spend_grid("a")[100]
+    h = 1e-4
+    exact = (
+        channel_response(np.array([s + h]), 2.0, 0.5, 4.0, 1.5, scaler_scale=0.3)
+        - channel_response(np.array([s - h]), 2.0, 0.5, 4.0, 1.5, scaler_scale=0.3)
+    ) / (2 * h)
+    assert curves.lookup("a", s, kind="marginal") == pytest.approx(exact[0], rel=1e-3)
+
+
+def test_save_load_roundtrip(curves, tmp_path):
+    p = tmp_path / "curves.npz"
+    curves.save(p)
+    loaded = ResponseCurves.load(p)
+    assert loaded.channels == ["a", "b"]
+    np.testing.assert_allclose(loaded.lookup("a", 3.3), curves.lookup("a", 3.3), rtol=1e-6)
+
+
+def test_unknown_channel_raises(curves):
+    with pytest.raises(KeyError, match="Unknown channel"):
+        curves.lookup("nope", 1.0)
+
+
+def test_alpha_one_has_no_steady_state():
+    with pytest.raises(ValueError, match="steady state"):
+        channel_response(np.array([1.0]), 1.0, alpha=1.0)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+from attrib_regression.cli import fit_single, load_data
+from attrib_regression.config import load_rba_config
+from attrib_regression.service import JobService, run_job, serve
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    cfg = yaml.safe_load((ROOT / "config" / "attribution.yml").read_text())
+    cfg["data"]["path"] = str(ROOT / "data" / "sample_daily.csv")
+    cfg["model"]["hyperparams"] = {"l1_ratio": [0.5], "alpha": [0.1]}
+    cfg["outputs"]["reports_dir"] = str(tmp_path / "reports")
+    p = tmp_path / "cfg.yml"
+    p.write_text(yaml.safe_dump(cfg))
+    return str(p)
+
+
+def test_score_job_returns_predictions(config_path):
+    out = run_job("score", {"config": config_path})
+    assert out["n_rows"] == len(out["pred"]) == 90
+
+
+def test_score_matches_fitted_design_with_log1p_features(config_path):
+    cfg_path = Path(config_path)
+    raw = yaml.safe_load(cfg_path.read_text())
+    raw["model"]["feature_transform"] = "log1p"
+    cfg_path.write_text(yaml.safe_dump(raw))
+
+    cfg = load_rba_config(config_path)
+    _, dm, fit, _ = fit_single(cfg, load_data(cfg))
+    expected = fit.model.predict(fit.scaler.transform(dm.X))
+
+    out = run_job("score", {"config": config_path})
+    np.testing.assert_allclose(out["pred"], expected)
+
+
+def test_score_output_confined_to_reports_dir(config_path, tmp_path):
+    out = run_job("score", {"config": config_path, "output": "scores/pred.csv"})
+    assert Path(out["output"]) == tmp_path / "reports" / "scores" / "pred.csv"
+    for bad in ("../escape.csv", str(tmp_path / "elsewhere.csv")):
+        with pytest.raises(ValueError, match="reports_dir"):
+            run_job("score", {"config": config_path, "output": bad})
+    assert not (tmp_path / "escape.csv").exists()
+    assert not (tmp_path / "elsewhere.csv").exists()
+
+
+def test_serve_refuses_non_loopback_host():
+    with pytest.raises(ValueError, match="allow-remote"):
+        asyncio.run(serve(host="0.0.0.0", port=0))
+
+
+def test_scenario_unit_multiplier_is_baseline(config_path):
+    out = run_job("scenario", {"config": config_path, "multipliers": {"social_spend": 1.0}})
+    assert out["delta"] == pytest.approx(0.0)
+
+
+def test_scenario_rejects_unknown_channel(config_path):
+    with pytest.raises(ValueError, match="Unknown media columns"):
+        run_job("scenario", {"config": config_path, "multipliers": {"nope": 2.0}})
+
+
+def test_submit_applies_backpressure():
+    async def go():
+        svc = JobService(max_workers=1, queue_size=1)  # not started: nothing drains
+        svc.submit("score", {"config": "x.yml"})
+        with pytest.raises(asyncio.QueueFull):
+            svc.submit("score", {"config": "x.yml"})
+        with pytest.raises(ValueError, match="Unknown job kind"):
+            svc.submit("bogus", {})
+
+    asyncio.run(go())
+
+
+def test_cache_replaces_stale_versions_and_is_bounded(monkeypatch):
+    from collections import OrderedDict
+
+    import attrib_regression.service as service
+
+    monkeypatch.setattr(service, "_CACHE_SIZE", 2)
+    cache = OrderedDict()
+    service._cached(cache, ("a",), (1,), lambda: "a1")
+    service._cached(cache, ("a",), (2,), lambda: "a2")
+    assert list(cache) == [(("a",), (2,))]
+    service._cached(cache, ("b",), (1,), lambda: "b1")
+    service._cached(cache, ("a",), (2,), lambda: "unused")  # hit refreshes recency
+    service._cached(cache, ("c",), (1,), lambda: "c1")
+    assert [k[0] for k in cache] == [("a",), ("c",)]
+
+
+class _Writer:
+    def __init__(self):
+        self.data = b""
+
+    def write(self, b):
+        self.data += b
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        pass
+
+
+async def _request(svc, method, path, body=b""):
+    reader = asyncio.StreamReader()
+    reader.feed_data(
+        f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    reader.feed_eof()
+    writer = _Writer()
+    await svc.handle(reader, writer)
+    head, _, payload = writer.data.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(payload)
+
+
+def test_http_job_runs_on_pool(config_path):
+    async def go():
+        svc = JobService(max_workers=1, queue_size=2)
+        await svc.start()
+        try:
+            body = json.dumps({"kind": "score", "params": {"config": config_path}}).encode()
+            status, resp = await _request(svc, "POST", "/jobs", body)
+            assert status == 202
+            await asyncio.wait_for(svc.queue.join(), timeout=60)
+            status, job = await _request(svc, "GET", f"/jobs/{resp['id']}")
+            assert status == 200
+            assert job["status"] == "done", job["error"]
+            assert job["result"]["n_rows"] == 90
+            status, _ = await _request(svc, "GET", "/jobs/nope")
+            assert status == 404
+        finally:
+            await svc.close()
+
+    asyncio.run(go())
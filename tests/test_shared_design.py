@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from attrib_regression.features.build_matrix import DesignMatrix
+from attrib_regression.features.shared_design import _call_attached, map_shared, share_design
+
+
+def _dm():
+    X = np.arange(12, dtype=float).reshape(4, 3)
+    return DesignMatrix(X=X, y=X.sum(axis=1), feature_names=["a", "b", "c"])
+
+
+def _col_sum(dm: DesignMatrix, j: int) -> float:
+    return float(dm.X[:, j].sum())
+
+
+def _n_shm_mappings() -> int:
+    with open("/proc/self/maps") as f:
+        return sum("/dev/shm/" in line for line in f)
+
+
+@pytest.mark.parametrize("backend", ["shm", "memmap"])
+def test_attach_roundtrip_is_read_only(backend):
+    dm = _dm()
+    with share_design(dm, backend=backend) as handle:
+        with handle.attach() as attached:
+            np.testing.assert_array_equal(attached.X, dm.X)
+            np.testing.assert_array_equal(attached.y, dm.y)
+            assert attached.feature_names == dm.feature_names
+            with pytest.raises(ValueError):
+                attached.X[0, 0] = 1.0
+        assert attached.X is None
+
+
+def test_memmap_files_removed_on_exit(tmp_path):
+    with share_design(_dm(), backend="memmap", dir=tmp_path) as handle:
+        assert Path(handle.x_ref).exists()
+    assert not Path(handle.x_ref).exists()
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(ValueError, match="Unknown backend"):
+        with share_design(_dm(), backend="nope"):
+            pass
+
+
+@pytest.mark.parametrize("backend", ["shm", "memmap"])
+def test_map_shared_runs_in_workers(backend):
+    dm = _dm()
+    out = map_shared(_col_sum, dm, range(3), max_workers=2, backend=backend)
+    assert out == [float(v) for v in dm.X.sum(axis=0)]
+
+
+@pytest.mark.skipif(not Path("/proc/self/maps").exists(), reason="needs /proc")
+def test_reused_worker_releases_mappings():
+    dm = _dm()
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        # start the worker first so it does not inherit the owner's mappings via fork
+        baseline = pool.submit(_n_shm_mappings).result()
+        for _ in range(3):
+            with share_design(dm, backend="shm") as handle:
+                assert pool.submit(_call_attached, _col_sum, handle, 0).result() == 18.0
+        assert pool.submit(_n_shm_mappings).result() == baseline
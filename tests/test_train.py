@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from attrib_regression.eval.tscv import TimeSeriesCV
+from attrib_regression.models import train
+from attrib_regression.models.train import (
+    _score_cell,
+    fit_elasticnet_adaptive_ts_cv,
+    fit_elasticnet_ts_cv,
+)
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0, 1, size=(120, 3))
+    y = 20.0 + X @ np.array([5.0, 2.0, 0.0]) + rng.normal(0, 0.2, 120)
+    return X, y
+
+
+def test_score_cell_abandons_after_first_fold(data):
+    X, y = data
+    folds = list(TimeSeriesCV(n_splits=3, test_size=10).split(len(y)))
+    out = _score_cell(X, y, folds, 0.1, 0.5, True, True, 42, abandon=lambda fm: True)
+    assert out is None
+    full = _score_cell(X, y, folds, 0.1, 0.5, True, True, 42)
+    assert len(full) == 3
+
+
+def _count_fits(monkeypatch):
+    calls = []
+    make_model = train._make_model
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return make_model(*args, **kwargs)
+
+    monkeypatch.setattr(train, "_make_model", counting)
+    return calls
+
+
+def test_adaptive_uses_fewer_fits_than_grid(monkeypatch):
+    rng = np.random.default_rng(2)
+    X = rng.uniform(0, 1, size=(120, 12))
+    y = 20.0 + X[:, :3] @ np.array([5.0, 2.0, 1.0]) + rng.normal(0, 1.5, 120)
+    names = [f"x{i}" for i in range(12)]
+    cv = TimeSeriesCV(n_splits=3, test_size=10)
+    grid = {"l1_ratio": [0.1, 0.3, 0.5, 0.8], "alpha": [0.001, 0.01, 0.1, 1.0]}
+    calls = _count_fits(monkeypatch)
+
+    grid_fit, _ = fit_elasticnet_ts_cv(X, y, names, True, True, cv, grid)
+    n_grid = len(calls)
+    assert n_grid == 16 * 3 + 1  # every cell x fold, plus the refit
+
+    calls.clear()
+    fit, params = fit_elasticnet_adaptive_ts_cv(X, y, names, True, True, cv, grid)
+    assert len(calls) < n_grid
+
+    grid_mape = np.mean([m["mape"] for m in grid_fit.metrics_by_fold])
+    adaptive_mape = np.mean([m["mape"] for m in fit.metrics_by_fold])
+    assert adaptive_mape <= grid_mape * 1.05
+    assert len(fit.metrics_by_fold) == 3
+    assert fit.metrics_by_fold[0]["alpha"] == params["alpha"]
+
+
+def test_adaptive_respects_fit_budget(data, monkeypatch):
+    X, y = data
+    cv = TimeSeriesCV(n_splits=3, test_size=10)
+    grid = {"l1_ratio": [0.1, 0.9], "alpha": [0.001, 1.0]}
+    calls = _count_fits(monkeypatch)
+
+    fit_elasticnet_adaptive_ts_cv(X, y, ["a", "b", "c"], True, True, cv, grid, max_fits=10, tol=0.0)
+    assert len(calls) <= 10 + 1  # budget, plus the refit